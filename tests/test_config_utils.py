@@ -0,0 +1,59 @@
+"""Tests for cached YAML config loading.
+
+Verifies that cached configs are invalidated on change and isolated from callers.
+"""
+
+import os
+import unittest
+import tempfile
+from pathlib import Path
+
+from vxc_adv_visualizer.utils.config_utils import load_yaml_config, clear_config_cache
+
+
+class TestConfigCache(unittest.TestCase):
+    """Test YAML config cache behavior."""
+
+    def setUp(self):
+        clear_config_cache()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.config_path = Path(self.temp_dir.name) / "config.yaml"
+        self.config_path.write_text("port: COM8\nbaudrate: 57600\n", encoding='utf-8')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+        clear_config_cache()
+
+    def test_load_parses_yaml(self):
+        """Test that config values are parsed."""
+        config = load_yaml_config(self.config_path)
+        self.assertEqual(config, {'port': 'COM8', 'baudrate': 57600})
+
+    def test_empty_file_returns_empty_dict(self):
+        """Test that an empty file loads as an empty dict."""
+        self.config_path.write_text("", encoding='utf-8')
+        self.assertEqual(load_yaml_config(self.config_path), {})
+
+    def test_returned_config_is_a_copy(self):
+        """Test that mutating a loaded config does not affect later loads."""
+        config = load_yaml_config(self.config_path)
+        config['port'] = 'COM1'
+        self.assertEqual(load_yaml_config(self.config_path)['port'], 'COM8')
+
+    def test_modified_file_is_reparsed(self):
+        """Test that a changed file invalidates the cached entry."""
+        load_yaml_config(self.config_path)
+        self.config_path.write_text("port: COM3\nbaudrate: 57600\n", encoding='utf-8')
+        st = self.config_path.stat()
+        os.utime(self.config_path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+        self.assertEqual(load_yaml_config(self.config_path)['port'], 'COM3')
+
+    def test_missing_file_raises(self):
+        """Test that a missing file raises OSError."""
+        with self.assertRaises(OSError):
+            load_yaml_config(Path(self.temp_dir.name) / "missing.yaml")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Tests for Cross-Section route building.
+
+Verifies route step values, workspace clamping and snake ordering of grid scans.
+"""
+
+import unittest
+
+import numpy as np
+
+from vxc_adv_visualizer.gui.cross_section_tab import CrossSectionTab
+
+X_MAX_STEPS = CrossSectionTab.X_MAX_STEPS
+Y_MAX_STEPS = CrossSectionTab.Y_MAX_STEPS
+
+
+def expected_steps(meters: float, max_steps: int) -> int:
+    """Per-point conversion and clamp as the original route loop did it."""
+    return max(0, min(CrossSectionTab._meters_to_steps(meters), max_steps))
+
+
+class TestRouteBuilding(unittest.TestCase):
+    """Test conversion of route coordinates to stage positions."""
+
+    def _assert_matches_per_point(self, positions, x_positions, y_positions):
+        self.assertEqual(len(positions), len(x_positions))
+        for pos, x_m, y_m in zip(positions, x_positions, y_positions):
+            self.assertEqual(pos['x_m'], x_m)
+            self.assertEqual(pos['y_m'], y_m)
+            self.assertEqual(pos['x_steps'], expected_steps(x_m, X_MAX_STEPS))
+            self.assertEqual(pos['y_steps'], expected_steps(y_m, Y_MAX_STEPS))
+            self.assertIsInstance(pos['x_steps'], int)
+            self.assertIsInstance(pos['y_steps'], int)
+
+    def test_vertical_line_steps(self):
+        """Test a vertical line: fixed X, evenly spaced Y."""
+        y_positions = np.linspace(0.05, 0.30, 6)
+        x_positions = np.full(6, 0.5)
+        positions = CrossSectionTab._build_route_positions(x_positions, y_positions)
+
+        self._assert_matches_per_point(positions, x_positions.tolist(), y_positions.tolist())
+        self.assertEqual({pos['x_steps'] for pos in positions}, {78740})
+        self.assertEqual(positions[0]['y_steps'], 7874)
+
+    def test_horizontal_line_steps(self):
+        """Test a horizontal line: fixed Y, evenly spaced X."""
+        x_positions = np.linspace(0.0, 1.0, 5)
+        y_positions = np.full(5, 0.1)
+        positions = CrossSectionTab._build_route_positions(x_positions, y_positions)
+
+        self._assert_matches_per_point(positions, x_positions.tolist(), y_positions.tolist())
+        self.assertEqual([pos['x_steps'] for pos in positions], [0, 39370, 78740, 118110, 157480])
+        self.assertEqual({pos['y_steps'] for pos in positions}, {15748})
+
+    def test_steps_clamped_to_workspace(self):
+        """Test that points just past either end of an axis are clamped."""
+        x_max_m = CrossSectionTab._steps_to_meters(X_MAX_STEPS)
+        y_max_m = CrossSectionTab._steps_to_meters(Y_MAX_STEPS)
+        x_positions = np.array([-0.001, x_max_m, x_max_m + 0.001])
+        y_positions = np.array([-0.001, y_max_m, y_max_m + 0.001])
+        positions = CrossSectionTab._build_route_positions(x_positions, y_positions)
+
+        self.assertEqual([pos['x_steps'] for pos in positions], [0, X_MAX_STEPS, X_MAX_STEPS])
+        self.assertEqual([pos['y_steps'] for pos in positions], [0, Y_MAX_STEPS, Y_MAX_STEPS])
+
+
+class TestSnakeGrid(unittest.TestCase):
+    """Test boustrophedon ordering of XY grid scans."""
+
+    def test_odd_rows_reversed(self):
+        """Test that even rows run left-to-right and odd rows right-to-left."""
+        x_line = np.array([0.1, 0.2, 0.3])
+        y_line = np.array([0.0, 0.05, 0.10, 0.15])
+        x_positions, y_positions = CrossSectionTab._snake_grid(x_line, y_line)
+
+        self.assertEqual(x_positions.tolist(), [
+            0.1, 0.2, 0.3,
+            0.3, 0.2, 0.1,
+            0.1, 0.2, 0.3,
+            0.3, 0.2, 0.1,
+        ])
+        self.assertEqual(y_positions.tolist(), [
+            0.0, 0.0, 0.0,
+            0.05, 0.05, 0.05,
+            0.10, 0.10, 0.10,
+            0.15, 0.15, 0.15,
+        ])
+
+    def test_input_row_not_modified(self):
+        """Test that reversing odd rows does not reverse the caller's X line."""
+        x_line = np.array([0.1, 0.2])
+        CrossSectionTab._snake_grid(x_line, np.array([0.0, 0.1]))
+        self.assertEqual(x_line.tolist(), [0.1, 0.2])
+
+    def test_grid_route_steps(self):
+        """Test that a snake grid converts to the same steps as per-point conversion."""
+        x_positions, y_positions = CrossSectionTab._snake_grid(
+            np.linspace(0.0, 1.0519, 4), np.linspace(0.0, 0.3661, 3)
+        )
+        positions = CrossSectionTab._build_route_positions(x_positions, y_positions)
+
+        self.assertEqual(len(positions), 12)
+        for pos, x_m, y_m in zip(positions, x_positions.tolist(), y_positions.tolist()):
+            self.assertEqual(pos['x_steps'], expected_steps(x_m, X_MAX_STEPS))
+            self.assertEqual(pos['y_steps'], expected_steps(y_m, Y_MAX_STEPS))
+        self.assertEqual(positions[3]['x_steps'], X_MAX_STEPS)
+        self.assertEqual(positions[4]['x_steps'], X_MAX_STEPS)  # Row 1 starts at the far end
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+"""Tests for Live Data per-location aggregation.
+
+Verifies that repeat measurements at one location are combined by
+sample-count-weighted averaging, matching the original per-field loop.
+"""
+
+import unittest
+
+from vxc_adv_visualizer.gui.live_data_tab import LiveDataTab
+
+
+NUMERIC_KEYS = [
+    'Raw Velocity.X (m/s)', 'Raw Velocity.Y (m/s)', 'Raw Velocity.Z (m/s)',
+    'Corrected Velocity.X (m/s)', 'Corrected Velocity.Y (m/s)', 'Corrected Velocity.Z (m/s)',
+    'Correlation.Avg (%)', 'SNR.Avg (dB)',
+    'Temperature (°C)', 'Raw Pressure (dbar)', 'Gauge Pressure (dbar)',
+    'Corrected Pressure (dbar)', 'Depth (m)', 'Voltage (V)',
+]
+
+
+def reference_weighted_averages(rows):
+    """Per-field weighted averages computed the way the original loop did."""
+    result = {}
+    for key in NUMERIC_KEYS:
+        values_and_weights = []
+        for row in rows:
+            val = LiveDataTab._parse_float(row.get(key))
+            weight = int(row.get('sample_count', 0))
+            if val is not None and weight > 0:
+                values_and_weights.append((val, weight))
+        if values_and_weights:
+            weighted_sum = sum(v * w for v, w in values_and_weights)
+            total_weight = sum(w for v, w in values_and_weights)
+            result[key] = f"{weighted_sum / total_weight:.6f}"
+    return result
+
+
+class TestLocationAggregation(unittest.TestCase):
+    """Test weighted averaging of measurements at one location."""
+
+    def _aggregate(self, rows):
+        return LiveDataTab._aggregate_location_rows(rows, 0.25, 0.125)
+
+    def test_weighted_average_of_complete_rows(self):
+        """Test that fields are averaged by sample count."""
+        rows = [
+            {'sample_count': '10', 'Corrected Velocity.X (m/s)': '0.2', 'timestamp_utc': 't1'},
+            {'sample_count': '30', 'Corrected Velocity.X (m/s)': '0.6', 'timestamp_utc': 't2'},
+        ]
+        result = self._aggregate(rows)
+
+        self.assertEqual(result['Corrected Velocity.X (m/s)'], '0.500000')
+        self.assertEqual(result['sample_count'], '40')
+        self.assertEqual(result['measurement_count'], '2')
+        self.assertEqual(result['x_m'], '0.250000')
+        self.assertEqual(result['y_m'], '0.125000')
+        self.assertEqual(result['timestamp_utc'], 't2')
+
+    def test_matches_reference_with_missing_values_and_weights(self):
+        """Test mixed missing values and zero/absent sample counts against the original loop."""
+        rows = [
+            {
+                'sample_count': '12',
+                'Corrected Velocity.X (m/s)': '0.31',
+                'Corrected Velocity.Y (m/s)': '',
+                'SNR.Avg (dB)': '18.5',
+                'Temperature (°C)': 'nan',
+                'Depth (m)': '0.42',
+            },
+            {
+                'sample_count': '0',  # Zero weight: contributes to no field
+                'Corrected Velocity.X (m/s)': '9.99',
+                'Corrected Velocity.Y (m/s)': '9.99',
+                'SNR.Avg (dB)': '99',
+            },
+            {
+                # No sample_count at all: treated as zero weight
+                'Corrected Velocity.X (m/s)': '-7.5',
+                'Depth (m)': '5.0',
+            },
+            {
+                'sample_count': '4',
+                'Corrected Velocity.X (m/s)': '0.27',
+                'Corrected Velocity.Y (m/s)': '-0.05',
+                'SNR.Avg (dB)': 'not-a-number',
+                'Temperature (°C)': '21.25',
+                'Depth (m)': 'inf',
+            },
+        ]
+        result = self._aggregate(rows)
+        expected = reference_weighted_averages(rows)
+
+        self.assertEqual({k: result[k] for k in NUMERIC_KEYS if k in result}, expected)
+        self.assertEqual(result['Corrected Velocity.X (m/s)'], '0.300000')
+        self.assertEqual(result['Corrected Velocity.Y (m/s)'], '-0.050000')
+        self.assertEqual(result['SNR.Avg (dB)'], '18.500000')
+        self.assertEqual(result['Temperature (°C)'], '21.250000')
+        self.assertEqual(result['Depth (m)'], '0.420000')
+        self.assertEqual(result['sample_count'], '16')
+
+    def test_field_without_valid_values_is_omitted(self):
+        """Test that a field with no valid, positively weighted value is left out."""
+        rows = [
+            {'sample_count': '5', 'Voltage (V)': '', 'Corrected Velocity.Z (m/s)': '0.1'},
+            {'sample_count': '0', 'Voltage (V)': '12.1', 'Corrected Velocity.Z (m/s)': '0.3'},
+        ]
+        result = self._aggregate(rows)
+
+        self.assertNotIn('Voltage (V)', result)
+        self.assertNotIn('Raw Velocity.X (m/s)', result)
+        self.assertEqual(result['Corrected Velocity.Z (m/s)'], '0.100000')
+
+
+if __name__ == '__main__':
+    unittest.main()
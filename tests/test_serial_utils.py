@@ -0,0 +1,33 @@
+"""Tests for serial port utilities.
+
+Verifies port enumeration order.
+"""
+
+import unittest
+from unittest import mock
+
+from serial.tools.list_ports_common import ListPortInfo
+
+from vxc_adv_visualizer.utils import serial_utils
+
+
+def _port(device: str, description: str = 'n/a') -> ListPortInfo:
+    info = ListPortInfo(device, skip_link_detection=True)
+    info.description = description
+    return info
+
+
+class TestListAvailablePorts(unittest.TestCase):
+    """Test COM port enumeration."""
+
+    def test_ports_in_natural_order(self):
+        """Test that COM9 sorts before COM10 (natural, not string, order)."""
+        ports = [_port('COM10'), _port('COM2'), _port('COM9'), _port('COM1')]
+        with mock.patch('serial.tools.list_ports.comports', return_value=ports):
+            result = serial_utils.list_available_ports()
+
+        self.assertEqual([name for name, _ in result], ['COM1', 'COM2', 'COM9', 'COM10'])
+
+
+if __name__ == '__main__':
+    unittest.main()
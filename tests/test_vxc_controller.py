@@ -0,0 +1,145 @@
+"""Tests for VXC controller command/response handling.
+
+Verifies reply polling (terminator and timeout), the bytes sent for a step
+program, and absolute-move axis mapping.
+"""
+
+import time
+import unittest
+from unittest import mock
+
+from vxc_adv_visualizer.controllers.vxc_controller import AXIS_MOTOR, VXCController
+
+
+class FakeSerial:
+    """Minimal serial port stand-in that replies with fixed bytes after a write."""
+
+    def __init__(self, reply: bytes = b'', endless: bool = False):
+        self.is_open = True
+        self.reply = reply
+        self.endless = endless
+        self.buffer = bytearray()
+        self.written = []
+
+    @property
+    def in_waiting(self):
+        return 1 if self.endless and self.written else len(self.buffer)
+
+    def reset_input_buffer(self):
+        self.buffer.clear()
+
+    def reset_output_buffer(self):
+        pass
+
+    def write(self, data):
+        self.written.append(data)
+        self.buffer.extend(self.reply)
+
+    def flush(self):
+        pass
+
+    def read(self, size=1):
+        if self.endless:
+            return b'x' * size
+        data = bytes(self.buffer[:size])
+        del self.buffer[:size]
+        return data
+
+
+class TestSendCommand(unittest.TestCase):
+    """Test send_command reply polling."""
+
+    def _controller(self, ser):
+        controller = VXCController(timeout=0.2)
+        controller.ser = ser
+        return controller
+
+    def test_reply_read_up_to_ready_marker(self):
+        """Test that a ready reply is returned as soon as '^' arrives."""
+        controller = self._controller(FakeSerial(reply=b'12^'))
+        response = controller.send_command('V', wait_for_response=True, response_type='ready')
+        self.assertEqual(response, '12^')
+
+    def test_chatty_port_still_times_out(self):
+        """Test that a port streaming non-terminator bytes cannot block past the timeout."""
+        controller = self._controller(FakeSerial(endless=True))
+
+        start = time.monotonic()
+        controller.send_command('V', wait_for_response=True, response_type='ready')
+        elapsed = time.monotonic() - start
+
+        self.assertLess(elapsed, 1.0)
+
+
+
+
+class TestStepMotor(unittest.TestCase):
+    """Test the step program sent to the controller and handling of its reply."""
+
+    def _controller(self, reply: bytes):
+        controller = VXCController(timeout=0.2)
+        controller.ser = FakeSerial(reply=reply)
+        controller.online = True
+        return controller
+
+    def test_program_sent_as_one_write_then_run(self):
+        """Test that clear/accel/speed/index go out in one write, followed by R."""
+        controller = self._controller(b'^')
+        ok = controller.step_motor(motor=2, steps=-400, speed=1500, acceleration=5)
+
+        self.assertTrue(ok)
+        self.assertEqual(controller.ser.written, [b'C,A2M5,S2M1500,I2M-400,', b'R'])
+
+    def test_fault_reply_fails(self):
+        """Test that a fault reply to R reports failure."""
+        controller = self._controller(b'F')
+        self.assertFalse(controller.step_motor(motor=1, steps=100))
+
+    def test_no_reply_fails(self):
+        """Test that a silent controller reports failure after the timeout."""
+        controller = self._controller(b'')
+        self.assertFalse(controller.step_motor(motor=1, steps=100))
+
+    def test_no_wait_returns_after_run(self):
+        """Test that wait=False sends the program and R without reading a reply."""
+        controller = self._controller(b'')
+        start = time.monotonic()
+        self.assertTrue(controller.step_motor(motor=1, steps=100, wait=False))
+        self.assertLess(time.monotonic() - start, 0.2)
+        self.assertEqual(controller.ser.written, [b'C,A1M2,S1M2000,I1M100,', b'R'])
+
+    def test_offline_sends_nothing(self):
+        """Test that motion commands are refused while offline."""
+        controller = self._controller(b'^')
+        controller.online = False
+        self.assertFalse(controller.step_motor(motor=1, steps=100))
+        self.assertEqual(controller.ser.written, [])
+
+class TestMoveAbsolute(unittest.TestCase):
+    """Test absolute moves built from relative step commands."""
+
+    def test_axes_mapped_to_motors_and_rounded(self):
+        """Test that X drives motor 2, Y drives motor 1, and deltas round to the nearest step."""
+        controller = VXCController()
+        positions = {2: 1000, 1: 500}
+        with mock.patch.object(controller, 'get_position', side_effect=lambda motor: positions[motor]), \
+                mock.patch.object(controller, 'step_motor') as step_motor:
+            controller.move_absolute(x=1250.7, y=497.6)
+
+        self.assertEqual(AXIS_MOTOR, {'X': 2, 'Y': 1})
+        self.assertEqual(step_motor.call_args_list, [
+            mock.call(motor=2, steps=251),
+            mock.call(motor=1, steps=-2),
+        ])
+
+    def test_sub_step_delta_sends_nothing(self):
+        """Test that a target within half a step of the current position is not moved to."""
+        controller = VXCController()
+        with mock.patch.object(controller, 'get_position', return_value=800), \
+                mock.patch.object(controller, 'step_motor') as step_motor:
+            controller.move_absolute(x=800.4)
+
+        step_motor.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -12,24 +12,37 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# VXC motor number for each stage axis (Motor 2 = X, Motor 1 = Y)
+AXIS_MOTOR = {'X': 2, 'Y': 1}
+
 
 class VXCController:
     """Controller for Velmex VXC XY stage via USB/Serial.
     
     Simple ASCII command protocol matching Velmex documentation.
     """
+
+    RESPONSE_POLL_SEC = 0.005  # Idle wait between in_waiting checks
     
-    def __init__(self, port: str = 'COM8', baudrate: int = 57600, timeout: float = 1):
+    def __init__(
+        self,
+        port: str = 'COM8',
+        baudrate: int = 57600,
+        timeout: float = 1,
+        settle_sec: float = 0.1
+    ):
         """Initialize VXC controller connection.
         
         Args:
             port: COM port name (default: 'COM8')
             baudrate: Baud rate (default: 57600)
             timeout: Serial timeout in seconds (default: 1)
+            settle_sec: Delay after opening the port before first command (default: 0.1)
         """
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
+        self.settle_sec = settle_sec
         self.ser = None
         self.online = False
         self.last_command_error: Optional[str] = None
@@ -54,7 +67,8 @@ class VXCController:
                 stopbits=serial.STOPBITS_ONE,
                 timeout=self.timeout
             )
-            time.sleep(0.1)  # Allow connection to stabilize
+            if self.settle_sec > 0:
+                time.sleep(self.settle_sec)  # Allow connection to stabilize
             logger.info(f"Connected to {self.port} at {self.baudrate} baud")
             
             # Go online with echo off
@@ -114,14 +128,16 @@ class VXCController:
                 # Send command
                 self.ser.write((command + terminator).encode('ascii'))
                 self.ser.flush()
-                logger.debug(f">> {command}")
+                logger.debug(">> %s", command)
 
                 if wait_for_response:
                     response = ""
-                    start_time = time.time()
+                    start_time = time.monotonic()
+                    deadline = start_time + self.timeout
 
                     while True:
-                        if self.ser.in_waiting > 0:
+                        waiting = self.ser.in_waiting
+                        if waiting > 0:
                             char = self.ser.read(1).decode('ascii', errors='ignore')
                             response += char
 
@@ -133,14 +149,19 @@ class VXCController:
                             elif response_type == 'status' and char in ['B', 'R', 'J', 'b', 'F']:
                                 break
 
-                        # Timeout check
-                        if time.time() - start_time > self.timeout:
-                            logger.warning(f"Timeout waiting for response to '{command}' (timeout={self.timeout:.1f}s, elapsed={time.time()-start_time:.2f}s)")
+                        # Timeout check - applies even while bytes keep arriving,
+                        # so a device streaming non-terminator data can't hold us here
+                        if time.monotonic() >= deadline:
+                            logger.warning(f"Timeout waiting for response to '{command}' (timeout={self.timeout:.1f}s, elapsed={time.monotonic()-start_time:.2f}s)")
                             break
 
-                    elapsed = time.time() - start_time
-                    logger.debug(f"← {response.strip()} ({elapsed:.3f}s)")
-                    return response.strip()
+                        if waiting == 0:
+                            # Nothing buffered - yield briefly instead of spinning
+                            time.sleep(self.RESPONSE_POLL_SEC)
+
+                    response = response.strip()
+                    logger.debug("← %s (%.3fs)", response, time.monotonic() - start_time)
+                    return response
 
                 return None
             
@@ -262,13 +283,13 @@ class VXCController:
         """
         try:
             position = int(response.strip())
-            logger.debug(f"Motor {motor} position: {position}")
+            logger.debug("Motor %d position: %d", motor, position)
             return position
         except ValueError:
             match = re.search(r"-?\d+", response)
             if match:
                 position = int(match.group(0))
-                logger.debug(f"Motor {motor} position (parsed): {position}")
+                logger.debug("Motor %d position (parsed): %d", motor, position)
                 return position
             logger.error(f"Invalid position response: {response}")
             return None
@@ -299,20 +320,11 @@ class VXCController:
         # Log the exact parameters for diagnostics
         logger.info(f"step_motor called: motor={motor}, steps={steps:+d}, speed={speed}, accel={acceleration}, timeout={self.timeout:.1f}s")
         
-        # Clear previous commands
-        self.clear_program()
-        
-        # Set acceleration
-        accel_cmd = f'A{motor}M{acceleration},'
-        self.send_command(accel_cmd)
-        
-        # Set speed
-        speed_cmd = f'S{motor}M{speed},'
-        self.send_command(speed_cmd)
-        
-        # Set index (step) command
-        index_cmd = f'I{motor}M{steps},'
-        self.send_command(index_cmd)
+        # Clear previous commands, then set acceleration, speed and index (step).
+        # The VXC accepts comma-delimited commands in one line, so the program
+        # goes out in a single write instead of one buffer reset/write per command.
+        program_cmd = f'C,A{motor}M{acceleration},S{motor}M{speed},I{motor}M{steps},'
+        self.send_command(program_cmd)
         
         logger.info(f"Commands queued: Motor {motor}, {steps:+d} steps @ {speed} steps/sec")
         
@@ -355,18 +367,18 @@ class VXCController:
             y: Target Y position in steps
         """
         if x is not None:
-            current_x = self.get_position(motor=1)
+            current_x = self.get_position(motor=AXIS_MOTOR['X'])
             if current_x is not None:
-                dx = int(x - current_x)
+                dx = round(x - current_x)  # Nearest step; int() would truncate toward zero
                 if dx != 0:
-                    self.step_motor(motor=1, steps=dx)
+                    self.step_motor(motor=AXIS_MOTOR['X'], steps=dx)
         
         if y is not None:
-            current_y = self.get_position(motor=2)
+            current_y = self.get_position(motor=AXIS_MOTOR['Y'])
             if current_y is not None:
-                dy = int(y - current_y)
+                dy = round(y - current_y)
                 if dy != 0:
-                    self.step_motor(motor=2, steps=dy)
+                    self.step_motor(motor=AXIS_MOTOR['Y'], steps=dy)
     
     def jog_to(self, target_x: int, target_y: int, speed: int = 2000, acceleration: int = 2) -> bool:
         """Jog to target position: X axis first, then Y axis.
@@ -1,5 +1,26 @@
-"""GUI module."""
+"""GUI module.
 
-from .main_window import MainWindow
+Exports are resolved on first access (PEP 562), so importing a single tab or
+widget module does not also load MainWindow and everything it imports.
+"""
 
-__all__ = ['MainWindow']
+import importlib
+
+_LAZY_EXPORTS = {
+    'MainWindow': 'main_window',
+}
+
+__all__ = list(_LAZY_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,6 +1,8 @@
 """Auto-Merge tab widget for file monitoring and automatic ADV-VXC merging."""
 
 import logging
+import time
+from collections import deque
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -56,6 +58,16 @@ class AutoMergeTab(QWidget):
         self.total_processed = 0
         self.total_failed = 0
         
+        # Activity log lines are buffered and flushed in batches so bursts of
+        # monitor events cost one layout/scroll instead of one per message
+        self._pending_log_html = deque()
+        self._log_flush_timer = QTimer(self)
+        self._log_flush_timer.setSingleShot(True)
+        self._log_flush_timer.setInterval(100)
+        self._log_flush_timer.timeout.connect(self._flush_activity_log)
+        self._log_ts_sec = -1  # Epoch second of the cached log timestamp
+        self._log_ts_text = ""
+        
         self._setup_ui()
     
     def _setup_ui(self):
@@ -214,6 +226,9 @@ class AutoMergeTab(QWidget):
         self.activity_log = QTextEdit()
         self.activity_log.setReadOnly(True)
         self.activity_log.setMaximumHeight(300)
+        # Cap log at 500 lines to prevent memory growth during long sessions;
+        # the document evicts the oldest blocks itself
+        self.activity_log.document().setMaximumBlockCount(500)
         self.activity_log.setStyleSheet("""
             QTextEdit {
                 background-color: #f8f8f8;
@@ -562,7 +577,12 @@ class AutoMergeTab(QWidget):
             message: Log message
             level: Log level (info, success, warning, error)
         """
-        timestamp = datetime.now().strftime("%H:%M:%S")
+        # Bursts land within the same second; only reformat when it rolls over
+        now_sec = int(time.time())
+        if now_sec != self._log_ts_sec:
+            self._log_ts_sec = now_sec
+            self._log_ts_text = time.strftime("%H:%M:%S", time.localtime(now_sec))
+        timestamp = self._log_ts_text
         
         # Color coding
         if level == "success":
@@ -574,26 +594,32 @@ class AutoMergeTab(QWidget):
         else:
             color = "#424242"  # Dark gray
         
-        # Add to log
+        # Queue for the next flush
         html = f'<span style="color: {color};"><b>[{timestamp}]</b> {message}</span>'
-        self.activity_log.append(html)
-
-        # Cap log at 500 lines to prevent memory growth during long sessions
-        _MAX_LOG_LINES = 500
-        doc = self.activity_log.document()
-        if doc.blockCount() > _MAX_LOG_LINES:
-            trim_cursor = QTextCursor(doc)
-            trim_cursor.movePosition(QTextCursor.Start)
-            trim_cursor.movePosition(QTextCursor.NextBlock, QTextCursor.KeepAnchor)
-            trim_cursor.removeSelectedText()
+        self._pending_log_html.append(html)
+        if not self._log_flush_timer.isActive():
+            self._log_flush_timer.start()
+    
+    def _flush_activity_log(self):
+        """Append all buffered activity log lines in one batch."""
+        if not self._pending_log_html:
+            return
+        
+        self.activity_log.setUpdatesEnabled(False)
+        try:
+            while self._pending_log_html:
+                self.activity_log.append(self._pending_log_html.popleft())
 
-        # Auto-scroll to bottom
-        cursor = self.activity_log.textCursor()
-        cursor.movePosition(QTextCursor.End)
-        self.activity_log.setTextCursor(cursor)
+            # Auto-scroll to bottom
+            cursor = self.activity_log.textCursor()
+            cursor.movePosition(QTextCursor.End)
+            self.activity_log.setTextCursor(cursor)
+        finally:
+            self.activity_log.setUpdatesEnabled(True)
     
     def _clear_activity_log(self):
         """Clear activity log."""
+        self._pending_log_html.clear()
         self.activity_log.clear()
         self._log_activity("Activity log cleared", "info")
     
@@ -12,7 +12,6 @@ from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
 import numpy as np
-import yaml
 from PyQt5.QtCore import QObject, QThread, pyqtSignal, Qt, QTimer
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QRadioButton,
@@ -21,6 +20,8 @@ from PyQt5.QtWidgets import (
 )
 
 from .range_slider import QRangeSlider
+from ..utils.config_utils import load_yaml_config
+from ..utils.units import METERS_PER_STEP, STEPS_PER_METER
 
 logger = logging.getLogger(__name__)
 
@@ -78,7 +79,7 @@ class CrossSectionWorker(QObject):
     def run(self):
         """Execute automated measurement sequence."""
         try:
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
             total = len(self.positions)
             
             # Calculate initial total estimated time
@@ -117,7 +118,7 @@ class CrossSectionWorker(QObject):
                 logger.info(f"{'='*80}")
                 
                 # Calculate time remaining
-                elapsed = time.time() - self.start_time
+                elapsed = time.monotonic() - self.start_time
                 
                 # Estimate remaining time based on remaining positions
                 remaining_time = 0.0
@@ -223,23 +224,29 @@ class CrossSectionWorker(QObject):
                 # Wait for data collection
                 self.status_update.emit(f"Position {i+1}/{total}: Collecting data for {self.dwell_time_sec:.1f}s...")
                 
-                # Check for stop during dwell time (check every 0.5s)
-                elapsed = 0.0
+                # Check for stop during dwell time (check every 0.5s). The dwell
+                # runs against a monotonic deadline so sleep overshoot and loop
+                # overhead don't stretch it; time spent paused extends it.
+                dwell_end = time.monotonic() + self.dwell_time_sec
                 check_interval = 0.5
-                while elapsed < self.dwell_time_sec:
+                while True:
                     if not self._running:
                         self.status_update.emit("Stopped by user")
                         return
                     
-                    while self._paused:
-                        time.sleep(0.1)
-                        if not self._running:
-                            self.status_update.emit("Stopped by user")
-                            return
+                    if self._paused:
+                        pause_start = time.monotonic()
+                        while self._paused:
+                            time.sleep(0.1)
+                            if not self._running:
+                                self.status_update.emit("Stopped by user")
+                                return
+                        dwell_end += time.monotonic() - pause_start
                     
-                    sleep_time = min(check_interval, self.dwell_time_sec - elapsed)
-                    time.sleep(sleep_time)
-                    elapsed += sleep_time
+                    remaining = dwell_end - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    time.sleep(min(check_interval, remaining))
                 
                 # Update progress
                 self.progress.emit(i + 1, total)
@@ -277,8 +284,6 @@ class CrossSectionTab(QWidget):
     """Tab for automated cross-section measurement control."""
     
     # Hardware constants
-    STEPS_PER_INCH = 4000.0
-    METERS_PER_FOOT = 0.3048
     X_MAX_STEPS = 165654  # Motor 2 (~1.0519 m)
     Y_MAX_STEPS = 57651   # Motor 1 (~0.3661 m)
     
@@ -290,7 +295,7 @@ class CrossSectionTab(QWidget):
         self.worker = None
         self.worker_thread = None
         self.calculated_positions = []
-        self.completed_positions = []
+        self.completed_positions = set()
         
         # ETA tracking
         self.eta_timer = QTimer()
@@ -326,8 +331,7 @@ class CrossSectionTab(QWidget):
             return
         
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f) or {}
+            config = load_yaml_config(config_path)
             
             automation = config.get("automation", {})
             self.default_dwell_time = float(automation.get("default_dwell_time_sec", 60.0))
@@ -616,7 +620,6 @@ class CrossSectionTab(QWidget):
         """Calculate and display the measurement route."""
         try:
             scan_type = self.scan_type_group.checkedId()
-            positions = []
             
             if scan_type == 0:  # Vertical line
                 x_m = self.x_fixed_spin.value()
@@ -628,25 +631,7 @@ class CrossSectionTab(QWidget):
                     return
                 
                 y_positions = np.linspace(y_start, y_end, y_count)
-                
-                for y_m in y_positions:
-                    x_steps = self._meters_to_steps(x_m)
-                    y_steps = self._meters_to_steps(y_m)
-                    # Clamp to bounds to handle floating-point precision at max values
-                    x_steps = max(0, min(x_steps, self.X_MAX_STEPS))
-                    y_steps = max(0, min(y_steps, self.Y_MAX_STEPS))
-                    
-                    if not self._validate_bounds(x_steps, y_steps):
-                        QMessageBox.warning(self, "Out of Bounds", 
-                                          f"Position out of workspace bounds: X={x_m:.4f}m, Y={y_m:.4f}m")
-                        return
-                    
-                    positions.append({
-                        'x_m': x_m,
-                        'y_m': y_m,
-                        'x_steps': x_steps,
-                        'y_steps': y_steps
-                    })
+                x_positions = np.full(y_count, x_m)
             
             elif scan_type == 1:  # Horizontal line
                 y_m = self.y_fixed_spin.value()
@@ -658,25 +643,7 @@ class CrossSectionTab(QWidget):
                     return
                 
                 x_positions = np.linspace(x_start, x_end, x_count)
-                
-                for x_m in x_positions:
-                    x_steps = self._meters_to_steps(x_m)
-                    y_steps = self._meters_to_steps(y_m)
-                    # Clamp to bounds to handle floating-point precision at max values
-                    x_steps = max(0, min(x_steps, self.X_MAX_STEPS))
-                    y_steps = max(0, min(y_steps, self.Y_MAX_STEPS))
-                    
-                    if not self._validate_bounds(x_steps, y_steps):
-                        QMessageBox.warning(self, "Out of Bounds", 
-                                          f"Position out of workspace bounds: X={x_m:.4f}m, Y={y_m:.4f}m")
-                        return
-                    
-                    positions.append({
-                        'x_m': x_m,
-                        'y_m': y_m,
-                        'x_steps': x_steps,
-                        'y_steps': y_steps
-                    })
+                y_positions = np.full(x_count, y_m)
             
             else:  # XY Grid
                 x_start, x_end = self.x_range_slider.values()
@@ -688,37 +655,15 @@ class CrossSectionTab(QWidget):
                     QMessageBox.warning(self, "Invalid Input", "Point counts must be at least 2")
                     return
                 
-                x_positions = np.linspace(x_start, x_end, x_count)
-                y_positions = np.linspace(y_start, y_end, y_count)
-                
-                # Create grid points with snake/boustrophedon pattern:
-                # Even rows (0, 2, 4...): left-to-right
-                # Odd rows (1, 3, 5...): right-to-left
-                for row_idx, y_m in enumerate(y_positions):
-                    # Reverse direction on odd rows for efficient snake pattern
-                    x_scan = x_positions if row_idx % 2 == 0 else x_positions[::-1]
-                    
-                    for x_m in x_scan:
-                        x_steps = self._meters_to_steps(x_m)
-                        y_steps = self._meters_to_steps(y_m)
-                        # Clamp to bounds to handle floating-point precision at max values
-                        x_steps = max(0, min(x_steps, self.X_MAX_STEPS))
-                        y_steps = max(0, min(y_steps, self.Y_MAX_STEPS))
-                        
-                        if not self._validate_bounds(x_steps, y_steps):
-                            QMessageBox.warning(self, "Out of Bounds", 
-                                              f"Position out of workspace bounds: X={x_m:.4f}m, Y={y_m:.4f}m")
-                            return
-                        
-                        positions.append({
-                            'x_m': x_m,
-                            'y_m': y_m,
-                            'x_steps': x_steps,
-                            'y_steps': y_steps
-                        })
+                x_positions, y_positions = self._snake_grid(
+                    np.linspace(x_start, x_end, x_count),
+                    np.linspace(y_start, y_end, y_count)
+                )
+            
+            positions = self._build_route_positions(x_positions, y_positions)
             
             self.calculated_positions = positions
-            self.completed_positions = []
+            self.completed_positions = set()
             
             # Update preview
             self._update_preview()
@@ -750,16 +695,14 @@ class CrossSectionTab(QWidget):
         lines = ["Position | X (m)      | Y (m)      | X (steps) | Y (steps) | Status"]
         lines.append("-" * 75)
         
+        completed = self.completed_positions
+        running = bool(self.worker and self.worker_thread and self.worker_thread.isRunning())
+        current_progress = len(completed)
+        
         for i, pos in enumerate(self.calculated_positions):
-            x_m = pos['x_m']
-            y_m = pos['y_m']
-            x_steps = pos['x_steps']
-            y_steps = pos['y_steps']
-            
-            if i in self.completed_positions:
+            if i in completed:
                 status = "✓ Complete"
-            elif self.worker and self.worker_thread and self.worker_thread.isRunning():
-                current_progress = len(self.completed_positions)
+            elif running:
                 if i == current_progress:
                     status = "→ Current"
                 elif i < current_progress:
@@ -769,8 +712,10 @@ class CrossSectionTab(QWidget):
             else:
                 status = "Pending"
             
-            line = f"{i+1:8d} | {x_m:10.4f} | {y_m:10.4f} | {x_steps:9d} | {y_steps:9d} | {status}"
-            lines.append(line)
+            lines.append(
+                f"{i+1:8d} | {pos['x_m']:10.4f} | {pos['y_m']:10.4f} | "
+                f"{pos['x_steps']:9d} | {pos['y_steps']:9d} | {status}"
+            )
         
         self.preview_text.setPlainText("\n".join(lines))
     
@@ -815,12 +760,12 @@ class CrossSectionTab(QWidget):
         self.stop_btn.setEnabled(True)
         
         # Reset progress
-        self.completed_positions = []
+        self.completed_positions = set()
         self.progress_bar.setValue(0)
         self.eta_label.setText("Calculating...")
         
         # Start ETA timer
-        self.automation_start_time = time.time()
+        self.automation_start_time = time.monotonic()
         self.total_pause_time = 0.0
         self.pause_start_time = None
         self.eta_timer.start(1000)  # Update every second
@@ -861,7 +806,7 @@ class CrossSectionTab(QWidget):
             self.worker.pause()
             self.pause_btn.setText("Resume")
             self.status_label.setText("Paused - Click Resume to continue")
-            self.pause_start_time = time.time()
+            self.pause_start_time = time.monotonic()
             self.eta_timer.stop()  # Stop ETA countdown while paused
             logger.info("Automation paused")
         else:
@@ -870,7 +815,7 @@ class CrossSectionTab(QWidget):
             self.status_label.setText("Resuming...")
             # Track total pause time
             if self.pause_start_time:
-                self.total_pause_time += time.time() - self.pause_start_time
+                self.total_pause_time += time.monotonic() - self.pause_start_time
                 self.pause_start_time = None
             self.eta_timer.start(1000)  # Resume ETA countdown
             logger.info("Automation resumed")
@@ -901,7 +846,7 @@ class CrossSectionTab(QWidget):
     
     def _on_position_reached(self, x_m: float, y_m: float, index: int):
         """Handle position reached signal from worker."""
-        self.completed_positions.append(index)
+        self.completed_positions.add(index)
         self._update_preview()
         logger.info(f"Position {index+1} reached: X={x_m:.4f}m, Y={y_m:.4f}m")
     
@@ -912,7 +857,7 @@ class CrossSectionTab(QWidget):
     def _on_eta_update(self, elapsed_sec: float, remaining_sec: float, current_pos: int, total_pos: int):
         """Handle ETA update from worker."""
         self.estimated_remaining_sec = remaining_sec
-        self.last_eta_update_time = time.time()
+        self.last_eta_update_time = time.monotonic()
     
     def _update_eta_display(self):
         """Update the ETA display with live countdown."""
@@ -920,11 +865,11 @@ class CrossSectionTab(QWidget):
             return
         
         # Calculate actual elapsed time (excluding pause time)
-        elapsed_total = time.time() - self.automation_start_time - self.total_pause_time
+        elapsed_total = time.monotonic() - self.automation_start_time - self.total_pause_time
         
         # Adjust remaining time based on time since last worker update
         if self.last_eta_update_time:
-            time_since_update = time.time() - self.last_eta_update_time
+            time_since_update = time.monotonic() - self.last_eta_update_time
             adjusted_remaining = max(0, self.estimated_remaining_sec - time_since_update)
         else:
             adjusted_remaining = self.estimated_remaining_sec
@@ -983,7 +928,7 @@ class CrossSectionTab(QWidget):
         
         # Show final time if automation completed
         if self.automation_start_time:
-            final_elapsed = time.time() - self.automation_start_time - self.total_pause_time
+            final_elapsed = time.monotonic() - self.automation_start_time - self.total_pause_time
             elapsed_min = int(final_elapsed // 60)
             elapsed_sec = int(final_elapsed % 60)
             self.eta_label.setText(f"✓ Completed in {elapsed_min:02d}:{elapsed_sec:02d}")
@@ -1025,17 +970,16 @@ class CrossSectionTab(QWidget):
                         route_file = session_dir / "route_plan.csv"
                         
                         import csv
+                        # Build rows up front so the file is written in one pass
+                        dwell_time = self.dwell_time_spin.value()
+                        rows = [
+                            (i, f"{pos['x_m']:.4f}", f"{pos['y_m']:.4f}", pos['x_steps'], pos['y_steps'], dwell_time)
+                            for i, pos in enumerate(self.calculated_positions, start=1)
+                        ]
                         with open(route_file, 'w', newline='', encoding='utf-8') as f:
                             writer = csv.writer(f)
                             writer.writerow(['point_number', 'x_m', 'y_m', 'x_steps', 'y_steps', 'estimated_dwell_sec'])
-                            
-                            dwell_time = self.dwell_time_spin.value()
-                            for i, pos in enumerate(self.calculated_positions, start=1):
-                                x_m = pos['x_m']
-                                y_m = pos['y_m']
-                                x_steps = pos['x_steps']
-                                y_steps = pos['y_steps']
-                                writer.writerow([i, f"{x_m:.4f}", f"{y_m:.4f}", x_steps, y_steps, dwell_time])
+                            writer.writerows(rows)
                         
                         # Update session config with scan parameters
                         scan_type = "Vertical_Line" if self.vertical_radio.isChecked() else \
@@ -1080,27 +1024,55 @@ class CrossSectionTab(QWidget):
                       self.dwell_time_spin, self.settling_time_spin]:
             widget.setEnabled(enabled)
     
-    def _meters_to_steps(self, meters: float) -> int:
+    @staticmethod
+    def _meters_to_steps(meters: float) -> int:
         """Convert meters to steps."""
-        feet = meters / self.METERS_PER_FOOT
-        inches = feet * 12.0
-        steps = int(round(inches * self.STEPS_PER_INCH))
-        return steps
+        return int(round(meters * STEPS_PER_METER))
     
-    def _steps_to_meters(self, steps: float) -> float:
+    @staticmethod
+    def _steps_to_meters(steps: float) -> float:
         """Convert steps to meters."""
-        inches = steps / self.STEPS_PER_INCH
-        feet = inches / 12.0
-        meters = feet * self.METERS_PER_FOOT
-        return meters
+        return steps * METERS_PER_STEP
+    
+    @staticmethod
+    def _snake_grid(x_line: np.ndarray, y_line: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Lay out grid points in a snake/boustrophedon pattern.
+        
+        Even rows (0, 2, 4...) run left-to-right, odd rows (1, 3, 5...)
+        right-to-left, so the stage never makes a full-width return move.
+        
+        Args:
+            x_line: X coordinates of one row (m)
+            y_line: Y coordinate of each row (m)
+            
+        Returns:
+            Tuple of (x_positions, y_positions), one entry per grid point in visit order
+        """
+        x_grid = np.tile(x_line, (len(y_line), 1))
+        x_grid[1::2] = x_grid[1::2, ::-1]
+        return x_grid.ravel(), np.repeat(y_line, len(x_line))
     
-    def _validate_bounds(self, x_steps: int, y_steps: int) -> bool:
-        """Validate that position is within workspace bounds."""
-        if x_steps < 0 or x_steps > self.X_MAX_STEPS:
-            return False
-        if y_steps < 0 or y_steps > self.Y_MAX_STEPS:
-            return False
-        return True
+    @classmethod
+    def _build_route_positions(cls, x_positions: np.ndarray, y_positions: np.ndarray) -> List[Dict]:
+        """Convert route coordinates in meters to position dicts in one pass.
+        
+        Args:
+            x_positions: X coordinate of each route point (m)
+            y_positions: Y coordinate of each route point (m), same length
+            
+        Returns:
+            List of position dicts with x_m, y_m, x_steps, y_steps
+        """
+        # Clamp to bounds to handle floating-point precision at max values
+        x_steps = np.clip(np.rint(x_positions * STEPS_PER_METER), 0, cls.X_MAX_STEPS).astype(np.int64)
+        y_steps = np.clip(np.rint(y_positions * STEPS_PER_METER), 0, cls.Y_MAX_STEPS).astype(np.int64)
+        
+        return [
+            {'x_m': x_m, 'y_m': y_m, 'x_steps': xs, 'y_steps': ys}
+            for x_m, y_m, xs, ys in zip(
+                x_positions.tolist(), y_positions.tolist(), x_steps.tolist(), y_steps.tolist()
+            )
+        ]
     
     def _update_y_range_label(self, low: float, high: float):
         """Update Y range label when slider changes."""
@@ -7,7 +7,6 @@ from pathlib import Path
 from typing import Optional, Tuple, List
 
 import numpy as np
-import yaml
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib import cm
@@ -19,14 +18,15 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt
 from PyQt5.QtGui import QFont
 
+from ..utils.config_utils import load_yaml_config
+from ..utils.units import METERS_PER_STEP
+
 logger = logging.getLogger(__name__)
 
 
 class LiveDataTab(QWidget):
     """Live Data tab showing normalized velocity vectors for averaged data."""
 
-    STEPS_PER_INCH = 4000.0
-    METERS_PER_FOOT = 0.3048
     PLANE_X_STEPS = (0, 165654)  # Positive X axis: 0 to ~1.0519m
     PLANE_Y_STEPS = (0, 57651)   # Positive Y axis: 0 to ~0.3661m
 
@@ -37,6 +37,7 @@ class LiveDataTab(QWidget):
         self.colorbar = None
         self._cached_rows: List[dict] = []  # In-memory cache — avoids re-reading CSV on every position update
         self.current_position_m: Optional[Tuple[float, float]] = None
+        self._position_marker = None  # Line2D for the current position, moved in place
         self._setup_ui()
 
     def _setup_ui(self):
@@ -387,14 +388,16 @@ class LiveDataTab(QWidget):
         logger.info(f"Loaded {len(all_rows)} total measurements, grouped into {len(aggregated_rows)} unique locations")
         return aggregated_rows
 
-    def _aggregate_location_rows(self, rows: List[dict], x_loc: float, y_loc: float) -> dict:
+    @classmethod
+    def _aggregate_location_rows(cls, rows: List[dict], x_loc: float, y_loc: float) -> dict:
         """Aggregate multiple measurements at the same location.
         
         Combines sample counts and computes weighted averages of velocity
         and quality metrics across all measurements at this location.
         """
-        # Sum total sample count across all measurements
-        total_samples = sum(int(row.get('sample_count', 0)) for row in rows)
+        # Sample counts double as the averaging weights
+        sample_counts = [int(row.get('sample_count', 0)) for row in rows]
+        total_samples = sum(sample_counts)
         
         # Weighted average of velocities and metrics
         velocity_keys = [
@@ -416,27 +419,30 @@ class LiveDataTab(QWidget):
             'measurement_count': str(len(rows))  # Track how many measurements combined
         }
         
-        # Weighted average for each numeric field
-        for key in velocity_keys + quality_keys + env_keys:
-            values_and_weights = []
-            for row in rows:
-                val = self._parse_float(row.get(key))
-                weight = int(row.get('sample_count', 0))
-                if val is not None and weight > 0:
-                    values_and_weights.append((val, weight))
-            
-            if values_and_weights:
-                # Weighted average: sum(value * weight) / sum(weight)
-                weighted_sum = sum(v * w for v, w in values_and_weights)
-                total_weight = sum(w for v, w in values_and_weights)
+        # Weighted average for each numeric field, all fields at once:
+        # (rows x fields) value matrix, missing values as NaN
+        numeric_keys = velocity_keys + quality_keys + env_keys
+        values = np.array(
+            [[cls._parse_float(row.get(key)) for key in numeric_keys] for row in rows],
+            dtype=float
+        )
+        weights = np.array(sample_counts, dtype=float)[:, np.newaxis]
+        valid = ~np.isnan(values) & (weights > 0)
+        field_weights = np.where(valid, weights, 0.0)
+        
+        # Weighted average: sum(value * weight) / sum(weight)
+        weighted_sums = (np.where(valid, values, 0.0) * field_weights).sum(axis=0)
+        total_weights = field_weights.sum(axis=0)
+        for key, weighted_sum, total_weight in zip(numeric_keys, weighted_sums.tolist(), total_weights.tolist()):
+            if total_weight > 0:
                 aggregated[key] = f"{weighted_sum / total_weight:.6f}"
         
         # Use timestamp from most recent measurement
         if 'timestamp_utc' in rows[-1]:
             aggregated['timestamp_utc'] = rows[-1]['timestamp_utc']
         
-        logger.debug(f"Aggregated {len(rows)} measurements at ({x_loc:.3f}, {y_loc:.3f}) "
-                    f"with {total_samples} total samples")
+        logger.debug("Aggregated %d measurements at (%.3f, %.3f) with %d total samples",
+                     len(rows), x_loc, y_loc, total_samples)
         
         return aggregated
     
@@ -484,6 +490,7 @@ class LiveDataTab(QWidget):
         cmap = cm.get_cmap("RdYlBu_r")
 
         self.ax.clear()
+        self._position_marker = None
         self.ax.set_aspect("equal", adjustable="box")
         self.ax.set_xlabel("X (m)", fontsize=10, fontweight='bold')
         self.ax.set_ylabel("Y (m)", fontsize=10, fontweight='bold')
@@ -519,7 +526,7 @@ class LiveDataTab(QWidget):
         # Add current position marker as black dot (10px diameter)
         if self.current_position_m:
             x_pos, y_pos = self.current_position_m
-            self.ax.plot(x_pos, y_pos, 'ko', markersize=10, markeredgecolor='white', 
+            self._position_marker, = self.ax.plot(x_pos, y_pos, 'ko', markersize=10, markeredgecolor='white', 
                         markeredgewidth=1.0, label='Current Position', zorder=10)
             self.ax.legend(loc='upper right', fontsize=9, framealpha=0.9)
 
@@ -535,6 +542,7 @@ class LiveDataTab(QWidget):
 
     def _draw_placeholder(self, message: str):
         self.ax.clear()
+        self._position_marker = None
         self.ax.set_facecolor('#f8f9fa')
         self.ax.set_xticks([])
         self.ax.set_yticks([])
@@ -546,7 +554,8 @@ class LiveDataTab(QWidget):
                              edgecolor="#dee2e6", alpha=0.9))
         self.canvas.draw_idle()
 
-    def _parse_float(self, value: object) -> Optional[float]:
+    @staticmethod
+    def _parse_float(value: object) -> Optional[float]:
         try:
             if value is None:
                 return None
@@ -566,8 +575,7 @@ class LiveDataTab(QWidget):
             return default_spacing
 
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                config = yaml.safe_load(f) or {}
+            config = load_yaml_config(config_path)
             grid = config.get("grid", {})
             x_spacing_feet = float(grid.get("x_spacing_feet", 0))
             y_spacing_feet = float(grid.get("y_spacing_feet", 0))
@@ -605,6 +613,13 @@ class LiveDataTab(QWidget):
         """
         self.current_position_m = (x_m, y_m)
         
+        # Marker already on the plot - move it instead of rebuilding the
+        # scatter and colorbar; draw_idle coalesces bursts into one paint
+        if self._position_marker is not None:
+            self._position_marker.set_data([x_m], [y_m])
+            self.canvas.draw_idle()
+            return
+        
         # Redraw with cached data (no disk I/O)
         if self._cached_rows:
             self._plot_vectors(self._cached_rows)
@@ -742,6 +757,4 @@ class LiveDataTab(QWidget):
         return None
 
     def _steps_to_meters(self, steps: float) -> float:
-        inches = steps / self.STEPS_PER_INCH
-        feet = inches / 12.0
-        return feet * self.METERS_PER_FOOT
+        return steps * METERS_PER_STEP
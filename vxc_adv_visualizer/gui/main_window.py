@@ -5,11 +5,13 @@ not through direct program connection.
 """
 
 import logging
+import threading
 import time
 import yaml
 import queue
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Dict, List, Optional, Set, Tuple
 
 from PyQt5.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
@@ -20,8 +22,10 @@ from PyQt5.QtWidgets import (
 from PyQt5.QtCore import Qt, QTimer, QObject, QThread, pyqtSignal
 from PyQt5.QtGui import QFont
 
-from ..controllers.vxc_controller import VXCController
+from ..controllers.vxc_controller import AXIS_MOTOR, VXCController
+from ..utils.config_utils import load_yaml_config
 from ..utils.serial_utils import list_available_ports
+from ..utils.units import METERS_PER_STEP, MM_PER_STEP
 from .auto_merge_tab import AutoMergeTab
 from .live_data_tab import LiveDataTab
 from .cross_section_tab import CrossSectionTab
@@ -29,18 +33,67 @@ from ..data.vxc_position_logger import VXCPositionLogger
 
 logger = logging.getLogger(__name__)
 
+# Prefer the libyaml C emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeDumper as _YamlDumper
+
+
+# key -> (last emit time, repeats suppressed since)
+_throttled_log_state: Dict[str, Tuple[float, int]] = {}
+
+
+def _log_throttled(key: str, level: int, msg: str, *args, min_interval_sec: float = 1.0) -> None:
+    """Log at most once per interval for a given call site.
+
+    Repeats inside the interval are counted and reported with the next
+    message that gets through, so a flapping serial link can't flood the log.
+    Like the logging API, msg is %-formatted with args only if it is emitted.
+
+    Args:
+        key: Identifies the call site being throttled
+        level: logging level (e.g. logging.WARNING)
+        msg: Message format string
+        *args: Arguments merged into msg
+        min_interval_sec: Minimum time between emitted messages for this key
+    """
+    now = time.monotonic()
+    last_emit, suppressed = _throttled_log_state.get(key, (float('-inf'), 0))
+    if now - last_emit < min_interval_sec:
+        _throttled_log_state[key] = (last_emit, suppressed + 1)
+        return
+    _throttled_log_state[key] = (now, 0)
+    if suppressed:
+        logger.log(level, msg + " (%d similar suppressed)", *args, suppressed)
+    else:
+        logger.log(level, msg, *args)
+
 
 class VXCConnectWorker(QObject):
     """Background worker for VXC auto-detect and connection."""
 
+    MAX_PROBE_WORKERS = 8
+
     connected = pyqtSignal(object, str)
     failed = pyqtSignal(str)
 
-    def __init__(self, selected_port: Optional[str], baudrate: int, timeout: float = 1.0):
+    def __init__(
+        self,
+        selected_port: Optional[str],
+        baudrate: int,
+        timeout: float = 1.0,
+        settle_sec: float = 0.1,
+        unresponsive_ports: Optional[Set[str]] = None
+    ):
         super().__init__()
         self.selected_port = selected_port
         self.baudrate = baudrate
         self.timeout = timeout
+        self.settle_sec = settle_sec
+        # Ports that failed a probe on an earlier attempt; owned by the caller
+        # so the history outlives this one-shot worker
+        self.unresponsive_ports = unresponsive_ports if unresponsive_ports is not None else set()
 
     def run(self):
         port_entries = list_available_ports()
@@ -55,20 +108,75 @@ class VXCConnectWorker(QObject):
                 ordered_ports.append((self.selected_port, ""))
         ordered_ports.extend([p for p in port_entries if p not in ordered_ports])
 
+        candidates = []
         for port, desc in ordered_ports:
             if not self._is_likely_vxc_port(desc):
                 tried.append(f"{port} (skipped: {desc})")
                 continue
             tried.append(port)
-            controller = self._try_connect_port(port)
-            if controller is not None:
-                self.connected.emit(controller, port)
-                return
+            candidates.append(port)
+
+        # Previously silent ports go last (stable sort keeps preference order).
+        # The user's chosen port is never demoted - it may just have been off.
+        candidates.sort(key=lambda p: p != self.selected_port and p in self.unresponsive_ports)
+
+        found = None
+        if candidates and candidates[0] == self.selected_port:
+            # Try the chosen port on its own first; if it answers, no other
+            # port (e.g. the ADV) is opened or sent probe bytes
+            found = self._probe_ports(candidates[:1])
+            candidates = candidates[1:]
+        if found is None:
+            found = self._probe_ports(candidates)
+        if found is not None:
+            controller, port = found
+            self.connected.emit(controller, port)
+            return
 
         self.failed.emit(f"VXC controller not found. Tried: {', '.join(tried)}")
 
+    def _probe_ports(self, candidates: List[str]) -> Optional[Tuple[VXCController, str]]:
+        """Probe candidate ports concurrently and return the first hit in preference order.
+
+        Each port is an independent serial handle, so the open/settle/status
+        waits overlap instead of adding up across ports.
+        """
+        if not candidates:
+            return None
+
+        found = None
+        with ThreadPoolExecutor(max_workers=min(self.MAX_PROBE_WORKERS, len(candidates))) as pool:
+            futures = [pool.submit(self._try_connect_port, port) for port in candidates]
+            # Walk results in preference order so the selected port still wins
+            for port, future in zip(candidates, futures):
+                if found is not None and future.cancel():
+                    continue  # Never started - no need to probe past a hit
+                controller = future.result()
+                if controller is None:
+                    if found is None:
+                        self.unresponsive_ports.add(port)
+                    continue
+                self.unresponsive_ports.discard(port)
+                if found is None:
+                    found = (controller, port)
+                    # Drop queued probes that haven't opened their port yet
+                    for pending in futures:
+                        pending.cancel()
+                else:
+                    controller.close()  # Only one controller is handed to the GUI
+        return found
+
     def _try_connect_port(self, port: str) -> Optional[VXCController]:
-        controller = VXCController(port, self.baudrate, timeout=self.timeout)
+        try:
+            return self._connect_and_verify(port)
+        except Exception as e:
+            logger.warning(f"Probe of {port} failed: {e}")
+            return None
+
+    def _connect_and_verify(self, port: str) -> Optional[VXCController]:
+        controller = VXCController(
+            port, self.baudrate, timeout=self.timeout, settle_sec=self.settle_sec
+        )
         if not controller.connect():
             controller.close()
             return None
@@ -104,9 +212,11 @@ class VXCPositionWorker(QObject):
         self.interval_sec = interval_sec
         self._running = False
         self._error_backoff_sec = 1.0
+        self._wake = threading.Event()
 
     def start(self):
         self._running = True
+        self._wake.clear()
         while self._running:
             try:
                 x = self.controller.get_position(motor=2)
@@ -119,10 +229,17 @@ class VXCPositionWorker(QObject):
             except Exception as e:
                 self.error.emit(str(e))
                 time.sleep(self._error_backoff_sec)
-            time.sleep(self.interval_sec)
+            # Interruptible wait so refresh()/stop() take effect immediately
+            self._wake.wait(self.interval_sec)
+            self._wake.clear()
+
+    def refresh(self):
+        """Poll again now instead of waiting out the interval (thread-safe)."""
+        self._wake.set()
 
     def stop(self):
         self._running = False
+        self._wake.set()
 
 
 class VXCLogWorker(QObject):
@@ -173,14 +290,15 @@ class VXCLogWorker(QObject):
                     consecutive_errors = 0  # Reset error counter on success
                 else:
                     # VXC not responding - log (0,0) to maintain timeline
-                    logger.warning("VXC position unavailable, logging (0,0)")
+                    _log_throttled("vxc_log_no_response", logging.WARNING,
+                                   "VXC position unavailable, logging (0,0)")
                     self.logger.log_position(x_steps=0, y_steps=0, quality="NO_RESPONSE")
                     consecutive_errors += 1
                     
             except Exception as e:
                 consecutive_errors += 1
                 error_msg = f"VXC logging error (#{consecutive_errors}): {e}"
-                logger.error(error_msg)
+                _log_throttled("vxc_log_exception", logging.ERROR, "%s", error_msg)
                 self.error.emit(error_msg)
                 
                 # Try to log error position to maintain timeline
@@ -226,18 +344,36 @@ class SliderJogWorker(QObject):
 
     progress = pyqtSignal(str)
     completed = pyqtSignal()
+    already_at_target = pyqtSignal()
     failed = pyqtSignal(str)
 
-    def __init__(self, controller, delta_x: int, delta_y: int, speed: int = 2000):
+    def __init__(self, controller, target_x: int, target_y: int, speed: int = 2000):
         super().__init__()
         self.controller = controller
-        self.delta_x = delta_x
-        self.delta_y = delta_y
+        self.target_x = target_x
+        self.target_y = target_y
+        self.delta_x = 0
+        self.delta_y = 0
         self.speed = speed
 
     def run(self):
-        """Execute X-first, then Y movement in the background thread."""
+        """Read the current position, then move X first and Y second in the background thread."""
         try:
+            current_x = self.controller.get_position(motor=AXIS_MOTOR['X'])
+            current_y = self.controller.get_position(motor=AXIS_MOTOR['Y'])
+            if current_x is None or current_y is None:
+                self.failed.emit("Cannot read current VXC position.")
+                return
+
+            self.delta_x = self.target_x - current_x
+            self.delta_y = self.target_y - current_y
+            if self.delta_x == 0 and self.delta_y == 0:
+                self.already_at_target.emit()
+                return
+
+            logger.info(f"Slider jog: ({current_x},{current_y}) -> ({self.target_x},{self.target_y}), "
+                        f"delta X={self.delta_x:+d} Y={self.delta_y:+d}")
+
             if self.delta_x != 0:
                 self.progress.emit(f"Moving X axis ({self.delta_x:+d} steps)...")
                 timeout = abs(self.delta_x) / max(self.speed, 1) + 3.0
@@ -320,7 +456,7 @@ class FindOriginWorker(QObject):
 
     def _find_axis_limit(self, axis: str, direction: int):
         """Find a single axis limit. Returns position in steps or None on failure."""
-        motor = 2 if axis == "X" else 1
+        motor = AXIS_MOTOR[axis]
         start_time = time.time()
         iteration = 0
         stall_count = 0
@@ -433,7 +569,7 @@ class BoundaryFindWorker(QObject):
         self.max_seconds = max_seconds
 
     def run(self):
-        motor = 2 if self.axis == "X" else 1
+        motor = AXIS_MOTOR[self.axis]
         start_time = time.time()
         iteration = 0
         stall_count = 0
@@ -537,9 +673,13 @@ class BoundaryFindWorker(QObject):
 class MainWindow(QMainWindow):
     """VXC Controller + Auto-Merge GUI for FlowTracker2 data integration."""
 
-    STEPS_PER_INCH = 4000.0
-    METERS_PER_FOOT = 0.3048
-    METERS_PER_INCH = 0.0254
+    VXC_TAB_STYLESHEET = """
+        QPushButton[role="action"]:hover { background-color: #e0e0e0; }
+        QPushButton[role="jog"]:hover { background-color: #b3d9ff; }
+        QLabel[role="readout"] { font-size: 16pt; font-weight: bold; }
+        QLabel[role="slider-position"] { font-weight: bold; color: #007bff; }
+        QLabel[role="hint"] { color: #6c757d; font-size: 9pt; }
+    """
     
     def __init__(self, config_dir: str = "./config"):
         """Initialize main window.
@@ -567,10 +707,15 @@ class MainWindow(QMainWindow):
         self.jog_repeat_delay_ms = 300
         self.jog_repeat_active = False
         self.jog_distances_m = [0.00635, 0.0127, 0.01905, 0.0254]
+        # Step count per jog distance, indexed like vxc_step_combo
+        self._jog_step_table = tuple(int(round(d / METERS_PER_STEP)) for d in self.jog_distances_m)
+        self._jog_step_steps = self._jog_distance_to_steps(1)  # Cached for the selected jog distance
         self.slider_being_adjusted = False  # Track if user is interacting with sliders
+        self._last_vxc_pos: Optional[Tuple[int, int]] = None  # Last position painted to the UI
         self.vxc_connect_thread: Optional[QThread] = None
         self.vxc_connect_worker: Optional[VXCConnectWorker] = None
         self.vxc_connecting = False
+        self._vxc_unresponsive_ports: Set[str] = set()  # Probe history across connect attempts
         self.vxc_poll_thread: Optional[QThread] = None
         self.vxc_poll_worker: Optional[VXCPositionWorker] = None
         self.vxc_log_thread: Optional[QThread] = None
@@ -606,8 +751,7 @@ class MainWindow(QMainWindow):
         if not config_path.exists():
             config_path = Path(__file__).resolve().parents[1] / "config" / filename
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return yaml.safe_load(f) or {}
+            return load_yaml_config(config_path)
         except Exception as e:
             logger.error(f"Failed to load {filename}: {e}")
             return {}
@@ -652,6 +796,9 @@ class MainWindow(QMainWindow):
     def _create_vxc_tab(self) -> QWidget:
         """Create VXC controller tab."""
         widget = QWidget()
+        # Shared look for repeated controls, parsed once and matched by the
+        # "role" property instead of a stylesheet per widget
+        widget.setStyleSheet(self.VXC_TAB_STYLESHEET)
         layout = QVBoxLayout()
         layout.setSpacing(12)
         layout.setContentsMargins(12, 12, 12, 12)
@@ -669,12 +816,12 @@ class MainWindow(QMainWindow):
         conn_layout.addWidget(self.vxc_status_label)
 
         self.vxc_autodetect_btn = QPushButton("Auto Detect VXC")
-        self.vxc_autodetect_btn.setStyleSheet("QPushButton:hover { background-color: #e0e0e0; }")
+        self.vxc_autodetect_btn.setProperty("role", "action")
         self.vxc_autodetect_btn.clicked.connect(self._auto_detect_vxc)
         conn_layout.addWidget(self.vxc_autodetect_btn)
         
         self.vxc_disconnect_btn = QPushButton("Disconnect")
-        self.vxc_disconnect_btn.setStyleSheet("QPushButton:hover { background-color: #e0e0e0; }")
+        self.vxc_disconnect_btn.setProperty("role", "action")
         self.vxc_disconnect_btn.clicked.connect(self._disconnect_vxc)
         self.vxc_disconnect_btn.setEnabled(False)
         conn_layout.addWidget(self.vxc_disconnect_btn)
@@ -688,13 +835,13 @@ class MainWindow(QMainWindow):
         pos_layout = QHBoxLayout()
         
         self.vxc_x_label = QLabel("X: --- m")
-        self.vxc_x_label.setStyleSheet("font-size: 16pt; font-weight: bold;")
+        self.vxc_x_label.setProperty("role", "readout")
         pos_layout.addWidget(self.vxc_x_label)
         
         pos_layout.addSpacing(20)
         
         self.vxc_y_label = QLabel("Y: --- m")
-        self.vxc_y_label.setStyleSheet("font-size: 16pt; font-weight: bold;")
+        self.vxc_y_label.setProperty("role", "readout")
         pos_layout.addWidget(self.vxc_y_label)
         
         pos_layout.addStretch()
@@ -711,6 +858,7 @@ class MainWindow(QMainWindow):
         self.vxc_step_combo = QComboBox()
         self.vxc_step_combo.addItems(["6.35 mm", "12.7 mm", "19.05 mm", "25.4 mm"])
         self.vxc_step_combo.setCurrentIndex(1)
+        self.vxc_step_combo.currentIndexChanged.connect(self._on_jog_step_changed)
         step_layout.addWidget(self.vxc_step_combo)
         step_layout.addStretch()
         jog_layout.addLayout(step_layout)
@@ -720,7 +868,7 @@ class MainWindow(QMainWindow):
         
         # Y+ button
         self.jog_y_plus = QPushButton("Y+")
-        self.jog_y_plus.setStyleSheet("QPushButton:hover { background-color: #b3d9ff; }")
+        self.jog_y_plus.setProperty("role", "jog")
         self.jog_y_plus.setMinimumHeight(60)
         self.jog_y_plus.pressed.connect(lambda: self._jog_start('Y', 1))
         self.jog_y_plus.released.connect(self._jog_stop)
@@ -728,7 +876,7 @@ class MainWindow(QMainWindow):
         
         # X- button
         self.jog_x_minus = QPushButton("X-")
-        self.jog_x_minus.setStyleSheet("QPushButton:hover { background-color: #b3d9ff; }")
+        self.jog_x_minus.setProperty("role", "jog")
         self.jog_x_minus.setMinimumHeight(60)
         self.jog_x_minus.pressed.connect(lambda: self._jog_start('X', -1))
         self.jog_x_minus.released.connect(self._jog_stop)
@@ -736,7 +884,7 @@ class MainWindow(QMainWindow):
         
         # X+ button
         self.jog_x_plus = QPushButton("X+")
-        self.jog_x_plus.setStyleSheet("QPushButton:hover { background-color: #b3d9ff; }")
+        self.jog_x_plus.setProperty("role", "jog")
         self.jog_x_plus.setMinimumHeight(60)
         self.jog_x_plus.pressed.connect(lambda: self._jog_start('X', 1))
         self.jog_x_plus.released.connect(self._jog_stop)
@@ -744,7 +892,7 @@ class MainWindow(QMainWindow):
         
         # Y- button
         self.jog_y_minus = QPushButton("Y-")
-        self.jog_y_minus.setStyleSheet("QPushButton:hover { background-color: #b3d9ff; }")
+        self.jog_y_minus.setProperty("role", "jog")
         self.jog_y_minus.setMinimumHeight(60)
         self.jog_y_minus.pressed.connect(lambda: self._jog_start('Y', -1))
         self.jog_y_minus.released.connect(self._jog_stop)
@@ -781,7 +929,7 @@ class MainWindow(QMainWindow):
         x_label_row = QHBoxLayout()
         x_label_row.addWidget(QLabel("X Position in Flume:"))
         self.x_position_label = QLabel("At origin (0 mm)")
-        self.x_position_label.setStyleSheet("font-weight: bold; color: #007bff;")
+        self.x_position_label.setProperty("role", "slider-position")
         x_label_row.addWidget(self.x_position_label)
         x_label_row.addStretch()
         x_slider_layout.addLayout(x_label_row)
@@ -798,7 +946,7 @@ class MainWindow(QMainWindow):
         
         x_max_mm = self._steps_to_mm(self.plane_x_max_distance)
         x_range_label = QLabel(f"Left=Origin (0 mm) | Right=Far Side ({x_max_mm:.1f} mm)")
-        x_range_label.setStyleSheet("color: #6c757d; font-size: 9pt;")
+        x_range_label.setProperty("role", "hint")
         x_slider_layout.addWidget(x_range_label)
         jog_to_layout.addLayout(x_slider_layout)
         
@@ -807,7 +955,7 @@ class MainWindow(QMainWindow):
         y_label_row = QHBoxLayout()
         y_label_row.addWidget(QLabel("Y Position (Depth):"))
         self.y_position_label = QLabel("At bottom (0 mm)")
-        self.y_position_label.setStyleSheet("font-weight: bold; color: #007bff;")
+        self.y_position_label.setProperty("role", "slider-position")
         y_label_row.addWidget(self.y_position_label)
         y_label_row.addStretch()
         y_slider_layout.addLayout(y_label_row)
@@ -824,7 +972,7 @@ class MainWindow(QMainWindow):
         
         y_max_mm = self._steps_to_mm(self.plane_y_max_distance)
         y_range_label = QLabel(f"Bottom=0 mm | Top={y_max_mm:.1f} mm")
-        y_range_label.setStyleSheet("color: #6c757d; font-size: 9pt;")
+        y_range_label.setProperty("role", "hint")
         y_slider_layout.addWidget(y_range_label)
         jog_to_layout.addLayout(y_slider_layout)
         
@@ -891,7 +1039,7 @@ class MainWindow(QMainWindow):
         btn_layout = QVBoxLayout()
         
         zero_btn = QPushButton("Zero Position")
-        zero_btn.setStyleSheet("QPushButton:hover { background-color: #e0e0e0; }")
+        zero_btn.setProperty("role", "action")
         zero_btn.setMinimumHeight(40)
         zero_btn.clicked.connect(self._vxc_zero)
         
@@ -912,14 +1060,19 @@ class MainWindow(QMainWindow):
         return widget
     
     def _setup_timers(self):
-        """Setup update timers."""
-        # VXC position update timer
-        self.vxc_timer = QTimer()
-        self.vxc_timer.timeout.connect(self._update_vxc_position)
+        """Setup update timers.
         
+        Position updates are pushed by VXCPositionWorker, so the GUI only owns
+        timers that run while something is active: jog repeat (while a jog
+        button is held) and the logging watchdog (while logging).
+        """
         # VXC jogging timer
-        self.jog_timer = QTimer()
+        self.jog_timer = QTimer(self)
         self.jog_timer.timeout.connect(self._jog_update)
+        
+        # VXC logging worker watchdog
+        self.vxc_log_health_timer = QTimer(self)
+        self.vxc_log_health_timer.timeout.connect(self._check_vxc_log_health)
     
     def _refresh_ports(self):
         """Refresh available serial ports."""
@@ -945,7 +1098,6 @@ class MainWindow(QMainWindow):
             return
             
         # Disconnect
-        self.vxc_timer.stop()
         self._stop_slider_jog()
         self._stop_vxc_polling()
         self._stop_vxc_logging()
@@ -975,6 +1127,7 @@ class MainWindow(QMainWindow):
         self.vxc_disconnect_btn.setEnabled(False)
         self.vxc_x_label.setText("X: ---")
         self.vxc_y_label.setText("Y: ---")
+        self._last_vxc_pos = None
         
         # Reset jog to position controls
         self.slider_being_adjusted = False
@@ -1003,8 +1156,12 @@ class MainWindow(QMainWindow):
         self.vxc_status_label.setStyleSheet("color: #c27c00; font-weight: bold;")
 
         baudrate = self.vxc_config.get('baudrate', 57600)
+        settle_sec = self.vxc_config.get('connect_settle_ms', 100) / 1000.0
         self.vxc_connect_thread = QThread()
-        self.vxc_connect_worker = VXCConnectWorker(selected_port, baudrate)
+        self.vxc_connect_worker = VXCConnectWorker(
+            selected_port, baudrate, settle_sec=settle_sec,
+            unresponsive_ports=self._vxc_unresponsive_ports
+        )
         self.vxc_connect_worker.moveToThread(self.vxc_connect_thread)
         self.vxc_connect_thread.started.connect(self.vxc_connect_worker.run)
         self.vxc_connect_worker.connected.connect(self._on_vxc_connected)
@@ -1043,7 +1200,8 @@ class MainWindow(QMainWindow):
         # Auto-start logging if monitoring is already enabled
         self.auto_merge_tab.handle_vxc_connected()
 
-        self._update_vxc_position()
+        # No explicit position read here: the poll worker started above reads
+        # immediately, and a refresh() now would just queue a duplicate read
         self.vxc_connecting = False
         self.vxc_autodetect_btn.setEnabled(True)
         
@@ -1098,16 +1256,12 @@ class MainWindow(QMainWindow):
         logger.info("VXC position logging thread started")
         
         # Start health monitoring timer
-        if not hasattr(self, 'vxc_log_health_timer'):
-            self.vxc_log_health_timer = QTimer()
-            self.vxc_log_health_timer.timeout.connect(self._check_vxc_log_health)
         self.vxc_log_health_timer.start(10000)  # Check every 10 seconds
         self._last_heartbeat = 0
 
     def _stop_vxc_logging(self):
         # Stop health monitoring
-        if hasattr(self, 'vxc_log_health_timer'):
-            self.vxc_log_health_timer.stop()
+        self.vxc_log_health_timer.stop()
         
         if self.vxc_log_worker is not None:
             self.vxc_log_worker.stop()
@@ -1118,23 +1272,36 @@ class MainWindow(QMainWindow):
         self.vxc_log_thread = None
     
     def _update_vxc_position(self):
-        """Update VXC position display."""
+        """Request a fresh VXC position read.
+
+        The serial read runs on the poll worker's thread and the result comes
+        back through position_updated, so the GUI never blocks on the port.
+        """
         if self.vxc is None or self._closing:
             return
-        
-        try:
-            x = self.vxc.get_position(motor=2)  # Motor 2 = X axis
-            y = self.vxc.get_position(motor=1)  # Motor 1 = Y axis
-            if x is not None and y is not None:
-                self._apply_vxc_position(x, y)
-        except Exception as e:
-            logger.error(f"Failed to get VXC position: {e}")
+
+        if self.vxc_poll_worker is not None:
+            self.vxc_poll_worker.refresh()
 
     def _apply_vxc_position(self, x_steps: int, y_steps: int):
-        x_m = self._steps_to_meters(x_steps)
-        y_m = self._steps_to_meters(y_steps)
-        self.vxc_x_label.setText(f"X: {x_m:.4f} m")
-        self.vxc_y_label.setText(f"Y: {y_m:.4f} m")
+        # Nothing is visible while minimized; leave the cache stale so the
+        # next update after restore repaints
+        if self.isMinimized():
+            return
+
+        # Stage idle - skip relabelling and the Live Data redraw
+        last_pos = self._last_vxc_pos
+        if (x_steps, y_steps) == last_pos:
+            return
+        self._last_vxc_pos = (x_steps, y_steps)
+
+        x_m = x_steps * METERS_PER_STEP
+        y_m = y_steps * METERS_PER_STEP
+        # Single-axis jogs leave the other label untouched
+        if last_pos is None or x_steps != last_pos[0]:
+            self.vxc_x_label.setText(f"X: {x_m:.4f} m")
+        if last_pos is None or y_steps != last_pos[1]:
+            self.vxc_y_label.setText(f"Y: {y_m:.4f} m")
 
         # Update live data tab with current position
         self.live_data_tab.update_current_position(x_m, y_m)
@@ -1165,7 +1332,7 @@ class MainWindow(QMainWindow):
         # VXCLogWorker now polls positions directly - no need to enqueue
 
     def _on_vxc_log_error(self, message: str):
-        logger.error(f"VXC log worker error: {message}")
+        _log_throttled("vxc_log_error", logging.ERROR, "VXC log worker error: %s", message)
     
     def _check_vxc_log_health(self):
         """Check if VXC logging worker is still alive."""
@@ -1181,7 +1348,7 @@ class MainWindow(QMainWindow):
         else:
             # Worker is alive and healthy
             self._last_heartbeat = current_heartbeat
-            logger.debug(f"VXC logging health check OK (heartbeat: {current_heartbeat})")
+            logger.debug("VXC logging health check OK (heartbeat: %s)", current_heartbeat)
     
     def _on_vxc_log_stopped(self):
         """Handle VXC logging worker stopped signal."""
@@ -1193,7 +1360,7 @@ class MainWindow(QMainWindow):
         self.vxc_log_thread = None
 
     def _on_vxc_position_error(self, message: str):
-        logger.warning(f"VXC position polling error: {message}")
+        _log_throttled("vxc_position_error", logging.WARNING, "VXC position polling error: %s", message)
 
     def _start_find_origin(self):
         """Start automated origin (0,0) finding process."""
@@ -1331,26 +1498,22 @@ class MainWindow(QMainWindow):
         try:
             config = {}
             if config_path.exists():
-                with open(config_path, "r", encoding="utf-8") as f:
-                    config = yaml.safe_load(f) or {}
+                config = load_yaml_config(config_path)
 
             config["boundaries"] = self.boundary_limits
             with open(config_path, "w", encoding="utf-8") as f:
-                yaml.safe_dump(config, f, sort_keys=False)
+                yaml.dump(config, f, Dumper=_YamlDumper, sort_keys=False)
 
             QMessageBox.information(self, "Boundaries Saved", f"Saved to {config_path}")
         except Exception as e:
             QMessageBox.critical(self, "Save Error", f"Failed to save boundaries:\n{e}")
 
     def _steps_to_meters(self, steps: float) -> float:
-        inches = steps / self.STEPS_PER_INCH
-        feet = inches / 12.0
-        return feet * self.METERS_PER_FOOT
+        return steps * METERS_PER_STEP
     
     def _steps_to_mm(self, steps: float) -> float:
         """Convert steps to millimeters."""
-        inches = steps / self.STEPS_PER_INCH
-        return inches * 25.4  # 25.4 mm per inch
+        return steps * MM_PER_STEP
     
     def _jog_start(self, axis: str, direction: int):
         """Start jogging VXC.
@@ -1387,28 +1550,33 @@ class MainWindow(QMainWindow):
 
         self._jog_step_once()
 
+    def _jog_distance_to_steps(self, step_index: int) -> int:
+        """Convert a jog distance combo index to a step count.
+        
+        Args:
+            step_index: Index into jog_distances_m (out-of-range falls back to 12.7 mm)
+            
+        Returns:
+            Unsigned step count for one jog
+        """
+        if 0 <= step_index < len(self._jog_step_table):
+            return self._jog_step_table[step_index]
+        return self._jog_step_table[1]
+
+    def _on_jog_step_changed(self, step_index: int):
+        """Cache the step count when the jog distance selection changes."""
+        self._jog_step_steps = self._jog_distance_to_steps(step_index)
+
     def _jog_step_once(self):
         """Execute a single jog step based on current UI settings."""
         if self.vxc is None or self.jog_axis is None:
             return
         
-        # Get jog distance in meters
-        step_index = self.vxc_step_combo.currentIndex()
-        if step_index < 0 or step_index >= len(self.jog_distances_m):
-            distance_m = self.jog_distances_m[1]
-        else:
-            distance_m = self.jog_distances_m[step_index]
-
-        steps_per_meter = self.STEPS_PER_INCH / self.METERS_PER_INCH
-        step = int(round(distance_m * steps_per_meter))
-        
         # Apply direction
-        step = step * self.jog_direction
+        step = self._jog_step_steps * self.jog_direction
         
         try:
-            # Convert axis letter to motor number
-            motor = 2 if self.jog_axis == 'X' else 1
-            self.vxc.step_motor(motor=motor, steps=step)
+            self.vxc.step_motor(motor=AXIS_MOTOR[self.jog_axis], steps=step)
         except Exception as e:
             logger.error(f"Jog failed: {e}")
             self._jog_stop()
@@ -1469,29 +1637,11 @@ class MainWindow(QMainWindow):
         target_x = self.x_slider.value()
         target_y = self.y_slider.value()
 
-        # Read current position — fast single query, acceptable on GUI thread
-        current_x = self.vxc.get_position(motor=2)
-        current_y = self.vxc.get_position(motor=1)
-
-        if current_x is None or current_y is None:
-            QMessageBox.critical(self, "Position Error", "Cannot read current VXC position.")
-            return
-
-        delta_x = target_x - current_x
-        delta_y = target_y - current_y
-
-        if delta_x == 0 and delta_y == 0:
-            self.jog_to_status.setText("Already at target position")
-            return
-
-        logger.info(f"Slider jog: ({current_x},{current_y}) -> ({target_x},{target_y}), "
-                    f"delta X={delta_x:+d} Y={delta_y:+d}")
-
-        # Disable GO button and update status for the duration of the move
+        # Disable GO button and update status for the duration of the move.
+        # The current-position read happens in the worker, so a slow reply
+        # never stalls the GUI thread.
         self.jog_go_btn.setEnabled(False)
-        first_msg = (f"Moving X axis ({delta_x:+d} steps)..."
-                     if delta_x != 0 else f"Moving Y axis ({delta_y:+d} steps)...")
-        self.jog_to_status.setText(first_msg)
+        self.jog_to_status.setText("Reading current position...")
         self.jog_to_status.setStyleSheet("color: #007bff; font-weight: bold;")
 
         # Disconnect live position->slider update so it doesn't fight the
@@ -1504,13 +1654,15 @@ class MainWindow(QMainWindow):
 
         # Build and start the background worker
         self.slider_jog_thread = QThread()
-        self.slider_jog_worker = SliderJogWorker(self.vxc, delta_x, delta_y)
+        self.slider_jog_worker = SliderJogWorker(self.vxc, target_x, target_y)
         self.slider_jog_worker.moveToThread(self.slider_jog_thread)
         self.slider_jog_thread.started.connect(self.slider_jog_worker.run)
         self.slider_jog_worker.progress.connect(self._on_slider_jog_progress)
         self.slider_jog_worker.completed.connect(self._on_slider_jog_completed)
+        self.slider_jog_worker.already_at_target.connect(self._on_slider_jog_already_at_target)
         self.slider_jog_worker.failed.connect(self._on_slider_jog_failed)
         self.slider_jog_worker.completed.connect(self.slider_jog_thread.quit)
+        self.slider_jog_worker.already_at_target.connect(self.slider_jog_thread.quit)
         self.slider_jog_worker.failed.connect(self.slider_jog_thread.quit)
         self.slider_jog_thread.finished.connect(self._cleanup_slider_jog_worker)
         self.slider_jog_thread.start()
@@ -1527,6 +1679,11 @@ class MainWindow(QMainWindow):
         QTimer.singleShot(2000, lambda: self.jog_to_status.setText("Ready"))
         QTimer.singleShot(2000, lambda: self.jog_to_status.setStyleSheet("color: #28a745;"))
 
+    def _on_slider_jog_already_at_target(self):
+        """Handle a slider jog whose target matches the current position."""
+        self.jog_to_status.setText("Already at target position")
+        self.jog_to_status.setStyleSheet("color: #28a745;")
+
     def _on_slider_jog_failed(self, error: str):
         """Handle jog failure."""
         self.jog_to_status.setText("Move failed")
@@ -1539,6 +1696,7 @@ class MainWindow(QMainWindow):
         self.slider_jog_worker = None
         self.slider_jog_thread = None
         self.slider_being_adjusted = False
+        self._last_vxc_pos = None  # Force sliders to resync even if the stage didn't move
 
         # Re-enable GO button if still connected
         if self.vxc is not None:
@@ -1579,14 +1737,25 @@ class MainWindow(QMainWindow):
                 # Zero vertical (Y) axis first (motor 1), then horizontal (X) axis (motor 2)
                 # VXC only allows one command at a time
                 self.vxc.send_command('N1')  # Zero motor 1 (Y axis)
-                time.sleep(0.1)
-                self.vxc.send_command('N2')  # Zero motor 2 (X axis)
-                logger.info("VXC position zeroed (Y then X)")
-                self._update_vxc_position()
+                # Give the controller 100 ms before the next command without
+                # blocking the event loop
+                QTimer.singleShot(100, self._vxc_zero_x_axis)
             except Exception as e:
                 QMessageBox.critical(self, "Zero Error", f"Failed to zero VXC:\n{e}")
                 logger.error(f"VXC zero failed: {e}")
     
+    def _vxc_zero_x_axis(self):
+        """Second half of _vxc_zero: zero the X axis once Y has been zeroed."""
+        if self.vxc is None or self._closing:
+            return
+        try:
+            self.vxc.send_command('N2')  # Zero motor 2 (X axis)
+            logger.info("VXC position zeroed (Y then X)")
+            self._update_vxc_position()
+        except Exception as e:
+            QMessageBox.critical(self, "Zero Error", f"Failed to zero VXC:\n{e}")
+            logger.error(f"VXC zero failed: {e}")
+    
     def _vxc_stop(self):
         """Emergency stop VXC - immediately halt all motion."""
         if self.vxc is None:
@@ -1613,7 +1782,6 @@ class MainWindow(QMainWindow):
         self._closing = True
         
         # Stop timers
-        self.vxc_timer.stop()
         self.jog_timer.stop()
         self._stop_slider_jog()
         self._stop_vxc_polling()
@@ -1623,20 +1791,39 @@ class MainWindow(QMainWindow):
         if hasattr(self, 'auto_merge_tab'):
             self.auto_merge_tab.cleanup()
         
-        # Stop VXC position logging if active
-        if self.vxc_logger is not None:
-            try:
-                if hasattr(self.vxc_logger, 'current_file') and self.vxc_logger.current_file:
-                    self.vxc_logger.stop_logging()
-            except Exception as e:
-                logger.error(f"Error stopping VXC logger: {e}")
-        
-        # Disconnect hardware
+        # Stop the position log and disconnect hardware in parallel on daemon
+        # threads; a wedged USB-serial driver must not keep the window open
+        shutdown_tasks = []
+        if self.vxc_logger is not None and getattr(self.vxc_logger, 'current_file', None):
+            shutdown_tasks.append(("stopping VXC logger", self.vxc_logger.stop_logging))
         if self.vxc is not None:
-            try:
-                self.vxc.close()
-            except Exception as e:
-                logger.error(f"Error closing VXC: {e}")
+            shutdown_tasks.append(("closing VXC", self.vxc.close))
+        self._run_shutdown_tasks(shutdown_tasks, timeout_sec=2.0)
         
         logger.info("MainWindow closed")
         event.accept()
+
+    def _run_shutdown_tasks(self, tasks: List[Tuple[str, Callable[[], None]]], timeout_sec: float):
+        """Run shutdown callables concurrently, waiting at most timeout_sec overall.
+
+        Args:
+            tasks: (description, callable) pairs
+            timeout_sec: Total time to wait before abandoning unfinished tasks
+        """
+        def _run(description: str, func: Callable[[], None]):
+            try:
+                func()
+            except Exception as e:
+                logger.error(f"Error {description}: {e}")
+
+        threads = []
+        for description, func in tasks:
+            thread = threading.Thread(target=_run, args=(description, func), daemon=True)
+            thread.start()
+            threads.append((description, thread))
+
+        deadline = time.monotonic() + timeout_sec
+        for description, thread in threads:
+            thread.join(max(0.0, deadline - time.monotonic()))
+            if thread.is_alive():
+                logger.warning(f"Timed out {description} after {timeout_sec:.1f}s - continuing shutdown")
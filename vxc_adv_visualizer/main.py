@@ -1,43 +1,73 @@
 """Application entry point for simplified VXC/ADV testing GUI."""
 
+import atexit
 import logging
+import queue
 import sys
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
+from typing import Optional
 
-from PyQt5.QtWidgets import QApplication
-
-from vxc_adv_visualizer.gui.main_window import MainWindow
-
-# Configure logging — rotate at 5 MB, keep 3 backups so logs never balloon on long runs
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        RotatingFileHandler(
-            'vxc_adv_system.log',
-            maxBytes=5 * 1024 * 1024,  # 5 MB per file
-            backupCount=3,             # Keep .log, .log.1, .log.2, .log.3
-            encoding='utf-8',
-        ),
-        logging.StreamHandler(sys.stdout),  # Explicit stdout avoids Windows cp1252 stderr issues
-    ]
-)
 logger = logging.getLogger(__name__)
 
+_log_listener: Optional[QueueListener] = None
+
+
+def _configure_logging() -> None:
+    """Route application logging through a queue to a background writer.
+
+    Rotates the log at 5 MB and keeps 3 backups so logs never balloon on long
+    runs. Records are handed to a queue and written by a listener thread, so
+    worker threads (e.g. VXC position logging) never block on file/console I/O.
+    The listener is stopped at interpreter exit, after any late records from
+    shutdown threads have been queued.
+    """
+    global _log_listener
+    if _log_listener is not None:
+        return
+
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    file_handler = RotatingFileHandler(
+        'vxc_adv_system.log',
+        maxBytes=5 * 1024 * 1024,  # 5 MB per file
+        backupCount=3,             # Keep .log, .log.1, .log.2, .log.3
+        encoding='utf-8',
+    )
+    stream_handler = logging.StreamHandler(sys.stdout)  # Explicit stdout avoids Windows cp1252 stderr issues
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, file_handler, stream_handler, respect_handler_level=True)
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    root_logger.addHandler(QueueHandler(log_queue))  # Left unformatted; the listener's handlers format
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
 
 def main():
     """Application entry point."""
+    _configure_logging()
+    
     # Create config directory if needed
     config_dir = "./config"
     Path(config_dir).mkdir(parents=True, exist_ok=True)
     
     logger.info("Starting VXC/ADV Hardware Testing Application...")
     
-    # Launch GUI
+    # Launch GUI (Qt is imported here so importing this module stays cheap)
+    from PyQt5.QtWidgets import QApplication
+
     qapp = QApplication(sys.argv)
     
     try:
+        # Imported here so the GUI/controller/matplotlib import graph loads
+        # after logging and the QApplication are up, and import failures are
+        # logged like any other startup error
+        from vxc_adv_visualizer.gui.main_window import MainWindow
+
         main_window = MainWindow(config_dir)
         main_window.show()
         
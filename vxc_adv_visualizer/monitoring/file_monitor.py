@@ -328,7 +328,7 @@ class FileMonitor(QObject):
         Args:
             path: Directory path that changed
         """
-        logger.debug(f"Directory changed: {path}")
+        logger.debug("Directory changed: %s", path)
         self._scan_for_new_files()
     
     def _poll_directory(self):
@@ -364,7 +364,7 @@ class FileMonitor(QObject):
         for csv_file in self.watch_dir.glob("*.csv"):
             # Validate filename format
             if not self.is_valid_adv_filename(csv_file.name):
-                logger.debug(f"Skipping non-ADV file: {csv_file.name}")
+                logger.debug("Skipping non-ADV file: %s", csv_file.name)
                 continue
             
             # Skip if already processed or pending
@@ -373,7 +373,7 @@ class FileMonitor(QObject):
             
             # Skip merged/averaged output files
             if '_merged' in csv_file.stem or '_avg_xy' in csv_file.stem:
-                logger.debug(f"Skipping output file: {csv_file.name}")
+                logger.debug("Skipping output file: %s", csv_file.name)
                 continue
             
             # New valid ADV file detected!
@@ -579,7 +579,7 @@ class FileMonitor(QObject):
             else:
                 # Still no VXC log
                 if attempt_count < 5:  # Max 5 attempts
-                    logger.debug(f"Retry {attempt_count+1}/5: Still no VXC log for {adv_file.name}")
+                    logger.debug("Retry %d/5: Still no VXC log for %s", attempt_count + 1, adv_file.name)
                     self.retry_queue.append((adv_file, attempt_count + 1))
                 else:
                     logger.warning(f"Giving up on {adv_file.name} after 5 retry attempts")
@@ -124,7 +124,7 @@ class VXCLogMatcher:
         for vxc_file in self.vxc_log_dir.glob("vxc_pos_*.csv"):
             # Validate VXC filename format
             if not self.is_valid_vxc_filename(vxc_file.name):
-                logger.debug(f"Skipping invalid VXC filename: {vxc_file.name}")
+                logger.debug("Skipping invalid VXC filename: %s", vxc_file.name)
                 continue
             
             try:
@@ -143,7 +143,7 @@ class VXCLogMatcher:
                     best_match = vxc_file
                     
             except (ValueError, IndexError) as e:
-                logger.debug(f"Skipping VXC file {vxc_file.name}: {e}")
+                logger.debug("Skipping VXC file %s: %s", vxc_file.name, e)
                 continue
         
         if best_match:
@@ -1,5 +1,21 @@
-"""Utility modules."""
+"""Utility modules.
 
-from . import serial_utils
+Submodules are imported on first attribute access (PEP 562), so importing
+``utils.config_utils`` does not also pull in pyserial via ``serial_utils``.
+"""
 
-__all__ = ['serial_utils']
+import importlib
+
+__all__ = ['config_utils', 'serial_utils', 'units']
+
+
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(f'.{name}', __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,70 @@
+"""YAML configuration loading with a parsed-result cache."""
+
+import copy
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+
+import yaml
+
+# libyaml's C parser is several times faster than the pure-Python one; PyYAML
+# wheels ship it on most platforms but fall back cleanly when absent
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+logger = logging.getLogger(__name__)
+
+# Parsed configs keyed by resolved path -> (st_mtime_ns, st_size, data)
+_CACHE_MAX_ENTRIES = 100
+_yaml_cache: "OrderedDict[str, Tuple[int, int, Dict[str, Any]]]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def load_yaml_config(path: Union[str, Path]) -> Dict[str, Any]:
+    """Load a YAML config file, reusing the parsed result while it is unchanged.
+
+    The cache entry is validated against the file's mtime and size, so edits
+    on disk are picked up on the next call.
+
+    Args:
+        path: Path to the YAML file
+
+    Returns:
+        Parsed configuration (empty dict for an empty file). Each call returns
+        an independent copy that the caller may modify.
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    resolved = str(Path(path).resolve())
+    st = os.stat(resolved)
+
+    with _cache_lock:
+        entry = _yaml_cache.get(resolved)
+        if entry is not None and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            _yaml_cache.move_to_end(resolved)
+            return copy.deepcopy(entry[2])
+
+    # Hand PyYAML the raw bytes; it decodes UTF-8/16 itself (in C with libyaml)
+    config = yaml.load(Path(resolved).read_bytes(), Loader=_SafeLoader) or {}
+    logger.debug("Parsed config %s", resolved)
+
+    with _cache_lock:
+        _yaml_cache[resolved] = (st.st_mtime_ns, st.st_size, config)
+        _yaml_cache.move_to_end(resolved)
+        while len(_yaml_cache) > _CACHE_MAX_ENTRIES:
+            _yaml_cache.popitem(last=False)
+
+    return copy.deepcopy(config)
+
+
+def clear_config_cache() -> None:
+    """Drop all cached configs (e.g. after writing a config file)."""
+    with _cache_lock:
+        _yaml_cache.clear()
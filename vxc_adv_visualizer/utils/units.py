@@ -0,0 +1,9 @@
+"""VXC stage unit conversion constants."""
+
+STEPS_PER_INCH = 4000.0
+METERS_PER_INCH = 0.0254
+METERS_PER_FOOT = 0.3048
+
+STEPS_PER_METER = STEPS_PER_INCH / METERS_PER_INCH
+METERS_PER_STEP = METERS_PER_INCH / STEPS_PER_INCH
+MM_PER_STEP = 25.4 / STEPS_PER_INCH